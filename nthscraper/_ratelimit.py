@@ -0,0 +1,46 @@
+"""Rate limiting for the nthscraper library"""
+
+import time
+import asyncio
+import threading
+
+
+class TokenBucket:
+    """
+    Token bucket pacing requests to `rate` per second on average,
+    allowing bursts of up to `capacity` requests without waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("TokenBucket needs rate > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return the seconds to wait before it is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """Block until a token is available, return the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """Wait on the event loop until a token is available."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
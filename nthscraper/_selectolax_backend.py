@@ -0,0 +1,156 @@
+"""selectolax parser backend for the nthscraper library"""
+
+from selectolax.parser import HTMLParser, Node
+from typing import Iterator, List, Optional
+from nthscraper.by import By
+from nthscraper.scraper import _DEFAULT_INNER_TEXT_FILTER, filter_inner_text
+from nthscraper.logger import setup_logger
+
+logger = setup_logger()
+
+
+def parse(content: bytes) -> Optional["SelectolaxElement"]:
+    """Parse an HTML document and return its root element."""
+    root = HTMLParser(content).root
+    return SelectolaxElement(root) if root is not None else None
+
+
+def _css_selector(by_mode: "By", to_search: str, tag: str) -> str:
+    """Translate a By mode into the CSS selector used to look up candidates."""
+    if by_mode is By.XPATH:
+        raise NotImplementedError("selectolax parser does not support By.XPATH")
+    if by_mode is By.CSS:
+        return to_search
+    if by_mode is By.ID:
+        return f'[id="{to_search}"]'
+    if by_mode is By.CLASS_NAME:
+        return f'[class~="{to_search}"]'
+    if by_mode is By.TAG_NAME:
+        return to_search
+    # text modes match on the candidates' own text below
+    return "*" if tag == "node()" else tag
+
+
+def _text_matches(node: Node, by_mode: "By", to_search: str) -> bool:
+    if by_mode is By.TEXT:
+        return " ".join(node.text(deep=False).split()) == to_search
+    if by_mode is By.LINK_TEXT:
+        return to_search in node.text(deep=False)
+    return True
+
+
+def _iter_css(
+    node: Node, selector: str, by_mode: "By", to_search: str
+) -> Iterator["SelectolaxElement"]:
+    """Yield the nodes matching selector under node, invalid selectors raise."""
+    for match in node.css(selector):
+        if _text_matches(match, by_mode, to_search):
+            yield SelectolaxElement(match)
+
+
+class SelectolaxElement:
+    """Represents a selectolax node with the NthScraperElement API."""
+
+    def __init__(self, node: Node):
+        if not isinstance(node, Node):
+            raise ValueError("Expected a selectolax.parser.Node instance.")
+        self.element: Node = node
+
+    def iter_find_elements(
+        self, by_mode: "By", to_search: str, tag: str = "node()"
+    ) -> Iterator["SelectolaxElement"]:
+        """
+        Lazily yield elements within this element, unsupported modes raise here
+        and invalid selectors raise while iterating.
+        """
+        selector = _css_selector(by_mode, to_search, tag)
+        return _iter_css(self.element, selector, by_mode, to_search)
+
+    def find_elements(
+        self, by_mode: "By", to_search: str, tag: str = "node()"
+    ) -> List["SelectolaxElement"]:
+        """Find multiple elements within this element."""
+        elements = self.iter_find_elements(by_mode, to_search, tag)
+        try:
+            return list(elements)
+        except Exception as e:
+            logger.error("%s %s: %s", by_mode, to_search, e)
+            return []
+
+    def find_element(
+        self, by_mode: "By", to_search: str, tag: str = "node()"
+    ) -> "SelectolaxElement":
+        """Find the first matching element within this element."""
+        element = self.find_element_or_none(by_mode, to_search, tag)
+        if element is None:
+            raise ValueError("Failed to find element.")
+        return element
+
+    def find_element_or_none(
+        self, by_mode: "By", to_search: str, tag: str = "node()"
+    ) -> Optional["SelectolaxElement"]:
+        """Like find_element but return None instead of raising when nothing matches."""
+        return next(self.iter_find_elements(by_mode, to_search, tag), None)
+
+    def get_text(self, all_text_content: bool = True) -> str:
+        """
+        all_text_content: if True (default), return all the text content of the element
+        else return text content of the element (sub element excluded)
+        """
+        if all_text_content is True:
+            return self.element.text(deep=True)
+        # like lxml's .text, only the text before the first child node
+        child = self.element.child
+        if child is None or child.tag != "-text":
+            return ""
+        return child.text_content or ""
+
+    def get_tag_name(self) -> str:
+        """Get the tag name of the element."""
+        return self.element.tag
+
+    def get_attribute(
+        self, attribute: str, inner_text_filter: List[str] = _DEFAULT_INNER_TEXT_FILTER
+    ) -> str:
+        """
+        Retrieve attributes or data from the element including innerText and innerHtml
+        :param attribute: Name of the attribute (e.g., 'class', 'id', 'innerText', 'innerHTML')
+        :param inner_text_filter: Filters to apply for filtering innerText,
+        :return: attributes as string, an attribute without a value such as
+        disabled returns its name like lxml (selectolax reads attr="" the same way)
+        """
+        if attribute == "innerText":
+            return filter_inner_text(self.get_text(), inner_text_filter)
+        if attribute == "innerHTML":
+            return self.element.html
+
+        attributes = self.element.attributes
+        if attribute not in attributes:
+            raise ValueError(f"Error accessing the attribute {attribute}")
+
+        attr_value = attributes[attribute]
+        return attr_value if attr_value is not None else attribute
+
+    def get_parent(self) -> Optional["SelectolaxElement"]:
+        parent = self.element.parent
+        # the <html> root's parent is the document node, lxml has none
+        if parent is None or parent.tag.startswith("-"):
+            return None
+        return SelectolaxElement(parent)
+
+    def iter_children(self, tag_name: str = "*") -> Iterator["SelectolaxElement"]:
+        """Lazily yield children of elements filtered by tag name"""
+        for child in self.element.iter():
+            # skip comments and other non-element nodes like lxml does
+            if child.tag.startswith(("_", "-")):
+                continue
+            if tag_name == "*" or child.tag == tag_name:
+                yield SelectolaxElement(child)
+
+    def get_children(self, tag_name: str = "*") -> List["SelectolaxElement"]:
+        """Get children of elements filtered by tag name"""
+        return list(self.iter_children(tag_name))
+
+    def __str__(self):
+        """Representation of SelectolaxElement object."""
+        return f"SelectolaxElement: <{self.get_tag_name()}> element instance."
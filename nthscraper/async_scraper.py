@@ -0,0 +1,111 @@
+"""Async batch requests for the nthscraper library"""
+
+import asyncio
+import random
+import aiohttp
+from lxml import etree, html
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from nthscraper.wrapper.requests_wrapper import RequestsWrapper
+from nthscraper.logger import setup_logger
+
+logger = setup_logger()
+
+FetchResult = Tuple[str, bytes, Optional[Any]]
+Parse = Callable[[bytes], Any]
+
+
+def _new_session(concurrency: int, wrapper: RequestsWrapper) -> aiohttp.ClientSession:
+    """Create a ClientSession with the wrapper's headers and a bounded connector."""
+    connector = aiohttp.TCPConnector(
+        limit=concurrency, ttl_dns_cache=300, keepalive_timeout=30
+    )
+    return aiohttp.ClientSession(
+        connector=connector, headers=dict(wrapper.session.headers)
+    )
+
+
+async def _fetch(
+    sem: asyncio.Semaphore,
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    sleep_range: Optional[Tuple[float, float]],
+    wrapper: RequestsWrapper,
+    headers: Dict[str, str],
+    parse: Parse,
+    **kwargs: Any,
+) -> FetchResult:
+    async with sem:
+        if sleep_range is not None:
+            await asyncio.sleep(random.uniform(*sleep_range))
+        else:
+            await wrapper.bucket.aacquire()
+        logger.info("%s from: url=%s, kwargs=%s", method, url, kwargs)
+
+        # Rotate the user agent like RequestsWrapper.request, caller headers win
+        headers = {"User-Agent": random.choice(wrapper.user_agents), **headers}
+        web_hit_count = wrapper.count_hit()
+        async with session.request(method, url, headers=headers, **kwargs) as resp:
+            logger.info("Response: status_code=%s", resp.status)
+            logger.info("web_hit_count=%s", web_hit_count)
+            resp.raise_for_status()
+            body = await resp.read()
+
+    # parsing is CPU bound, keep it off the event loop
+    loop = asyncio.get_running_loop()
+    try:
+        doc = await loop.run_in_executor(None, parse, body) if body else None
+    except (etree.ParserError, etree.XMLSyntaxError) as e:
+        logger.error("Failed to parse document from %s: %s", url, e)
+        doc = None
+    return url, body, doc
+
+
+async def fetch_many(
+    method: str,
+    urls: Iterable[str],
+    concurrency: int = 32,
+    sleep_range: Optional[Tuple[float, float]] = (1, 5),
+    wrapper: Optional[RequestsWrapper] = None,
+    return_exceptions: bool = True,
+    parse: Optional[Parse] = None,
+    **kwargs: Any,
+) -> List[Union[FetchResult, BaseException]]:
+    """
+    Send requests to all urls concurrently, at most `concurrency` at a time.
+    :param method: HTTP method, e.g. 'GET' or 'POST'
+    :param urls: urls to request
+    :param concurrency: maximum number of requests in flight
+    :param sleep_range: (low, high) seconds of random jitter before each request
+    :param wrapper: RequestsWrapper providing the headers, the hit count and
+    the rate limit used when sleep_range is None, a new one by default
+    :param return_exceptions: if True (default), a failed url gets its exception in
+    place of the tuple instead of the whole batch raising
+    :param parse: callable turning a body into a document, lxml.html.fromstring
+    by default
+    :return: list of (url, body, doc) tuples in the same order as urls
+    """
+    if concurrency < 1:
+        raise ValueError("fetch_many needs concurrency >= 1")
+    wrapper = wrapper if wrapper is not None else RequestsWrapper()
+    parse = parse if parse is not None else html.fromstring
+    headers = kwargs.pop("headers", None) or {}
+    sem = asyncio.Semaphore(concurrency)
+    async with _new_session(concurrency, wrapper) as session:
+        return await asyncio.gather(
+            *[
+                _fetch(
+                    sem,
+                    session,
+                    method,
+                    url,
+                    sleep_range,
+                    wrapper,
+                    headers,
+                    parse,
+                    **kwargs,
+                )
+                for url in urls
+            ],
+            return_exceptions=return_exceptions,
+        )
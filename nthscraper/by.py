@@ -1,5 +1,7 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Tuple, Dict
+from lxml import etree
 
 
 class By(Enum):
@@ -9,8 +11,10 @@ class By(Enum):
     LINK_TEXT = "TEXT_CONTAINS"
     TAG_NAME = "TAG_NAME"
     CLASS_NAME = "CLASS_NAME"
+    CSS = "CSS_SELECTOR"  # selectolax parser only, lxml raises NotImplementedError
 
 
+@lru_cache(maxsize=4096)
 def selector_mode_values(
     by_mode: "By", to_search: str, tag: str = "node()"
 ) -> Tuple[str, str]:
@@ -40,6 +44,17 @@ def selector_mode_values(
             f"<Error: Class '{to_search}' not found in HTML>",
             f'//*[contains(concat(" ", normalize-space(@class), " "), " {to_search} ")]',
         ),
+        # CSS selectors have no XPath form, only the selectolax parser runs them
+        "CSS_SELECTOR": (
+            f"<Error: CSS selector '{to_search}' not found in HTML>",
+            "",
+        ),
     }
 
     return selectors.get(str(by_mode.value), ("<Error: Invalid search mode>", ""))
+
+
+@lru_cache(maxsize=2048)
+def compiled_xpath(expr: str) -> etree.XPath:
+    """Compile an XPath expression once and reuse it on later lookups."""
+    return etree.XPath(expr)
@@ -0,0 +1,4 @@
+# Augmenting declarations used when scraper.py is compiled with Cython.
+
+cdef class NthScraperElement:
+    cdef public object element
@@ -1,16 +1,55 @@
-import random
-import requests
+from importlib import import_module
 from requests.models import Response
 from lxml import html
+from lxml import etree
 from lxml.etree import _Element, tostring
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Iterable, Iterator, Tuple, Dict, Union
+from typing import TYPE_CHECKING
 from nthscraper.wrapper.requests_wrapper import RequestsWrapper
-from nthscraper.wrapper.local_file_adapter import LocalFileAdapter
-from nthscraper.by import By, selector_mode_values
+from nthscraper.by import By, selector_mode_values, compiled_xpath
 from nthscraper.logger import setup_logger
 
+if TYPE_CHECKING:
+    from nthscraper._selectolax_backend import SelectolaxElement
+
 logger = setup_logger()
 
+# Documents and elements returned by NthScraper depend on the parser backend
+Document = Union[html.HtmlElement, "SelectolaxElement"]
+Element = Union["NthScraperElement", "SelectolaxElement"]
+
+_DEFAULT_INNER_TEXT_FILTER = ["\n", "\t"]
+_DEFAULT_STRIP_TABLE = str.maketrans("", "", "".join(_DEFAULT_INNER_TEXT_FILTER))
+
+
+def filter_inner_text(
+    text: str, inner_text_filter: List[str] = _DEFAULT_INNER_TEXT_FILTER
+) -> str:
+    """Remove every inner_text_filter pattern from text in order and strip it."""
+    if inner_text_filter is _DEFAULT_INNER_TEXT_FILTER:
+        return text.translate(_DEFAULT_STRIP_TABLE).strip()
+
+    # single characters can be stripped in one pass, order doesn't matter then
+    if all(len(rep) == 1 for rep in inner_text_filter):
+        return text.translate(str.maketrans("", "", "".join(inner_text_filter))).strip()
+
+    for rep in inner_text_filter:
+        text = text.replace(rep, "")
+    return text.strip()
+
+
+def _lxml_xpath(by_mode: "By", to_search: str, tag: str = "node()") -> str:
+    """Return the XPath for a lookup on an lxml document, By.CSS is not supported."""
+    if by_mode is By.CSS:
+        raise NotImplementedError("lxml parser does not support By.CSS")
+    return selector_mode_values(by_mode, to_search, tag)[1]
+
+
+def _iter_xpath(node: _Element, xpath: str) -> Iterator["NthScraperElement"]:
+    """Yield the elements matching xpath under node, invalid expressions raise."""
+    for element in compiled_xpath(xpath)(node):
+        yield NthScraperElement(element)
+
 
 class NthScraperElement:
     """Represents an HTML element in the nthscraper context."""
@@ -20,30 +59,47 @@ class NthScraperElement:
             raise ValueError("Expected an lxml.etree._Element instance.")
         self.element: _Element = element
 
+    def iter_find_elements(
+        self, by_mode: "By", to_search: str, tag: str = "node()"
+    ) -> Iterator["NthScraperElement"]:
+        """
+        Lazily yield elements within this element, unsupported modes raise here
+        and invalid selectors raise while iterating.
+        """
+        return _iter_xpath(self.element, _lxml_xpath(by_mode, to_search, tag))
+
     def find_elements(
         self, by_mode: "By", to_search: str, tag: str = "node()"
     ) -> List["NthScraperElement"]:
         """Find multiple elemnts within this element."""
-        err_message, xpath = selector_mode_values(by_mode, to_search, tag)
+        err_message, _ = selector_mode_values(by_mode, to_search, tag)
+        elements = self.iter_find_elements(by_mode, to_search, tag)
         try:
-            elements = self.element.xpath(xpath)
-            return (
-                [NthScraperElement(element) for element in elements] if elements else []
-            )
-        except Exception:
-            logger.error(f"{err_message}: {e}")
+            return list(elements)
+        except Exception as e:
+            logger.exception("%s: %s", err_message, e)
             return []
 
     def find_element(self, by_mode: "By", to_search: str) -> "NthScraperElement":
         """
         Attempt to find an HTML element by XPATH or other methods and return it wrapped in a NthScraperElement
         """
-        _, xpath = selector_mode_values(by_mode, to_search)
+        elements = self.iter_find_elements(by_mode, to_search)
         try:
-            element = self.element.xpath(xpath)[0]
+            element = next(elements, None)
         except Exception:
             raise ValueError("Failed to find element.")
-        return NthScraperElement(element)
+        if element is None:
+            raise ValueError("Failed to find element.")
+        return element
+
+    def find_element_or_none(
+        self, by_mode: "By", to_search: str
+    ) -> Optional["NthScraperElement"]:
+        """Like find_element but return None instead of raising when nothing matches."""
+        xpath = _lxml_xpath(by_mode, to_search)
+        elements = compiled_xpath(xpath)(self.element)
+        return NthScraperElement(elements[0]) if elements else None
 
     def get_text(self, all_text_content: bool = True) -> str:
         """
@@ -51,6 +107,9 @@ class NthScraperElement:
         else return text content of the element (sub element excluded)
         """
         if all_text_content is True:
+            # text_content() joins the text inside libxml2, only HtmlElement has it
+            if hasattr(self.element, "text_content"):
+                return self.element.text_content()
             return "".join(self.element.itertext())
         return self.element.text if self.element.text is not None else ""
 
@@ -59,7 +118,7 @@ class NthScraperElement:
         return self.element.tag
 
     def get_attribute(
-        self, attribute: str, inner_text_filter: List[str] = ["\n", "\t"]
+        self, attribute: str, inner_text_filter: List[str] = _DEFAULT_INNER_TEXT_FILTER
     ) -> str:
         """
         Retrieve various attributes or data from an HTML element including innerText and innerHtml
@@ -68,10 +127,7 @@ class NthScraperElement:
         :return: attributes as string
         """
         if attribute == "innerText":
-            text = self.get_text()
-            for rep in inner_text_filter:
-                text = text.replace(rep, "")
-            return text.strip()
+            return filter_inner_text(self.get_text(), inner_text_filter)
         if attribute == "innerHTML":
             return tostring(self.element, encoding="unicode", method="html")
 
@@ -85,95 +141,329 @@ class NthScraperElement:
         parent = self.element.getparent()
         return NthScraperElement(parent) if parent is not None else None
 
+    def iter_children(self, tag_name: str = "*") -> Iterator["NthScraperElement"]:
+        """
+        Lazily yield children of elements filtered by tag name.
+        A tag or relative path such as "p[@class]" runs as the cached XPath
+        "./<tag_name>", ElementPath only syntax such as "{namespace}tag" uses findall.
+        """
+        if tag_name == "*":
+            children = self.element.iterchildren(tag=etree.Element)
+        else:
+            try:
+                children = compiled_xpath(f"./{tag_name}")(self.element)
+            except etree.XPathSyntaxError:
+                children = self.element.findall(tag_name)
+        for child in children:
+            yield NthScraperElement(child)
+
     def get_children(self, tag_name: str = "*") -> List["NthScraperElement"]:
         """Get children of elements filtered by tag name"""
-        children = self.element.findall(tag_name)
-        return [NthScraperElement(child) for child in children]
+        return list(self.iter_children(tag_name))
 
     def __str__(self):
         """Representation of NthScraperElement object."""
         return f"NthScraperElement: <{self.get_tag_name()}> element instance."
 
 
+class HrefCollector:
+    """Parser target collecting the href of every <a> tag while parsing."""
+
+    def __init__(self) -> None:
+        self.out: List[str] = []
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if tag == "a" and "href" in attrib:
+            self.out.append(attrib["href"])
+
+    def end(self, tag: str) -> None:
+        pass
+
+    def data(self, data: str) -> None:
+        pass
+
+    def close(self) -> List[str]:
+        return self.out
+
+
 class NthScraper:
     """class to scrape websites following selenium-like rules"""
 
-    def __init__(self) -> None:
+    parsers = ("lxml", "selectolax")
+
+    def __init__(self, parser: str = "lxml") -> None:
+        """
+        :param parser: HTML parser backend, 'lxml' (default) or 'selectolax'.
+        selectolax is faster on large pages but only supports CSS based lookups.
+        """
+        if parser not in self.parsers:
+            raise ValueError(f"Unsupported parser: {parser}, use one of {self.parsers}")
+        self._parser = parser
+        self._doc_type: type = _Element
+        if parser == "selectolax":
+            try:
+                _selectolax_backend = import_module("nthscraper._selectolax_backend")
+            except ImportError as e:
+                raise ImportError(
+                    "The selectolax parser needs the selectolax package, "
+                    "install it with: pip install nthscraper[selectolax]"
+                ) from e
+            self._selectolax_parse = _selectolax_backend.parse
+            self._doc_type = _selectolax_backend.SelectolaxElement
         self.requests_wrapper: RequestsWrapper = RequestsWrapper()
-        self.doc = None
         self.response: Optional[Response] = None
+        self._raw_content: bytes = b""
+        self._doc: Optional[Document] = None
+        self._html_parser = html.HTMLParser(huge_tree=True, collect_ids=False)
+
+    def _parse(self, content: bytes) -> Optional[Document]:
+        """Parse content with the parser backend, lxml raises on unparsable input."""
+        if self._parser == "selectolax":
+            return self._selectolax_parse(content)
+        return html.fromstring(content, parser=self._html_parser)
+
+    @property
+    def doc(self) -> Optional[Document]:
+        """HTML document of the last response, parsed on first access."""
+        if self._doc is None and self._raw_content:
+            try:
+                self._doc = self._parse(self._raw_content)
+            except (etree.ParserError, etree.XMLSyntaxError) as e:
+                logger.error("Failed to parse the HTML document: %s", e)
+            # drop the body so an unparsable or empty document is only handled once
+            if self._doc is None:
+                self._raw_content = b""
+        return self._doc
+
+    @doc.setter
+    def doc(self, value: Optional[Document]) -> None:
+        self._doc = value
+
+    def _resolve_doc(self, doc: Optional[Document]) -> Optional[Document]:
+        """Return doc or the current document, checking it matches the parser."""
+        doc = doc if doc is not None else self.doc
+        if doc is not None and not isinstance(doc, self._doc_type):
+            raise TypeError(
+                f"Expected a {self._doc_type.__name__} document for the "
+                f"{self._parser} parser, got {type(doc).__name__}"
+            )
+        return doc
+
+    def _set_response(self, response: Response) -> Response:
+        """Keep the response body and drop the document parsed from the previous one."""
+        self.response = response
+        self._raw_content = response.content
+        self._doc = None
+        return response
+
+    def _set_streamed_response(self, response: Response) -> Response:
+        """
+        Parse the body straight from the connection without keeping a bytes copy,
+        response.content is not available afterwards.
+        """
+        self.response = response
+        self._raw_content = b""
+        with response:
+            response.raw.decode_content = True
+            tree = html.parse(response.raw, parser=self._html_parser)
+        self._doc = tree.getroot()
+        return response
 
     def _get_response(
         self,
         url: str,
+        method: str = "GET",
         sleep_seconds: Optional[int] = None,
-        is_post: bool = False,
         **kwargs: Any,
     ):
-        sleep_seconds = (
-            sleep_seconds if sleep_seconds is not None else random.randint(1, 5)
-        )
-        method = self.requests_wrapper.post if is_post else self.requests_wrapper.get
-        self.response = method(url, sleep_seconds=sleep_seconds, **kwargs)
-        self.doc = (
-            html.fromstring(self.response.content) if self.response.content else None
+        response = self.requests_wrapper.request(
+            method, url, sleep_seconds=sleep_seconds, **kwargs
         )
-        return self.response
+        # selectolax needs the whole body, only lxml can parse from the stream
+        if kwargs.get("stream") and self._parser == "lxml":
+            return self._set_streamed_response(response)
+        return self._set_response(response)
 
     def get(self, url: str, sleep_seconds: Optional[int] = None, **kwargs: Any):
-        return self._get_response(url, sleep_seconds, **kwargs)
+        """
+        GET a url and keep the response for find_element(s).
+        Pass stream=True to parse the body while it downloads instead of
+        keeping response.content, which is then not available.
+        """
+        return self._get_response(url, "GET", sleep_seconds, **kwargs)
 
     def get_from_local(self, file_path: str) -> Response:
-        session = requests.session()
-        session.mount("file://", LocalFileAdapter())
-        self.response = session.get(f"file://{file_path}")
-        logger.info(f"Scraping data from: {file_path}")
-        self.doc = (
-            html.fromstring(self.response.content) if self.response.content else None
-        )
+        # Go through the shared session directly, local reads don't need the sleep
+        self._set_response(self.requests_wrapper.session.get(f"file://{file_path}"))
+        logger.info("Scraping data from: %s", file_path)
         self.response.close()
         return self.response
 
     def post(self, url: str, sleep_seconds: Optional[int] = None, **kwargs: Any):
-        return self._get_response(url, sleep_seconds, is_post=True, **kwargs)
+        return self._get_response(url, "POST", sleep_seconds, **kwargs)
+
+    def stream_extract(
+        self,
+        url: str,
+        target: Any = None,
+        sleep_seconds: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Feed the response body into a parser target while it downloads,
+        no document is built so self.doc is not available afterwards.
+        :param url: url to request
+        :param target: lxml parser target, defaults to HrefCollector
+        :return: the value returned by target.close()
+        """
+        target = target if target is not None else HrefCollector()
+        parser = etree.HTMLParser(target=target)
+        self.response = self.requests_wrapper.get(
+            url, sleep_seconds=sleep_seconds, stream=True, **kwargs
+        )
+        self._raw_content = b""
+        self._doc = None
+        fed = False
+        with self.response:
+            for chunk in self.response.iter_content(chunk_size=64 * 1024):
+                if chunk:
+                    parser.feed(chunk)
+                    fed = True
+        # lxml raises on close when nothing was fed, an empty body has no matches
+        return parser.close() if fed else target.close()
+
+    async def aget(
+        self,
+        url: str,
+        sleep_range: Optional[Tuple[float, float]] = (1, 5),
+        **kwargs: Any,
+    ):
+        """Async GET of a single url, returns a (url, body, doc) tuple."""
+        results = await self.aget_many([url], 1, sleep_range, False, **kwargs)
+        return results[0]
+
+    async def aget_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 32,
+        sleep_range: Optional[Tuple[float, float]] = (1, 5),
+        return_exceptions: bool = True,
+        **kwargs: Any,
+    ):
+        """
+        Async GET of many urls, returns a list of (url, body, doc) tuples,
+        doc is parsed with this scraper's parser backend.
+        Requests use the requests wrapper headers and count towards its hit count,
+        pass sleep_range=None to pace with its rate limit instead of sleeping.
+        A url that fails gets its exception in place of the tuple unless
+        return_exceptions is False, then the first failure is raised.
+        """
+        from nthscraper.async_scraper import fetch_many
+
+        wrapper = self.requests_wrapper
+        return await fetch_many(
+            "GET",
+            urls,
+            concurrency,
+            sleep_range,
+            wrapper,
+            return_exceptions,
+            parse=self._parse,
+            **kwargs,
+        )
+
+    async def apost_many(
+        self,
+        urls: Iterable[str],
+        concurrency: int = 32,
+        sleep_range: Optional[Tuple[float, float]] = (1, 5),
+        return_exceptions: bool = True,
+        **kwargs: Any,
+    ):
+        """Async POST to many urls, same results and options as aget_many."""
+        from nthscraper.async_scraper import fetch_many
+
+        wrapper = self.requests_wrapper
+        return await fetch_many(
+            "POST",
+            urls,
+            concurrency,
+            sleep_range,
+            wrapper,
+            return_exceptions,
+            parse=self._parse,
+            **kwargs,
+        )
+
+    def iter_find_elements(
+        self,
+        by_mode: "By",
+        to_search: str,
+        doc: Optional[Document] = None,
+        tag: str = "node()",
+    ) -> Iterator[Element]:
+        """
+        Lazily yield matching elements, a missing document and unsupported modes
+        raise here and invalid selectors raise while iterating.
+        """
+        doc = self._resolve_doc(doc)
+        if doc is None:
+            raise ReferenceError("HTML Document is not a valid lxml object")
+        if self._parser == "selectolax":
+            return doc.iter_find_elements(by_mode, to_search, tag)
+        return _iter_xpath(doc, _lxml_xpath(by_mode, to_search, tag))
 
     def find_elements(
         self,
         by_mode: "By",
         to_search: str,
-        doc: Optional[html.HtmlElement] = None,
+        doc: Optional[Document] = None,
         tag: str = "node()",
-    ) -> List["NthScraperElement"]:
-        err_message, xpath = selector_mode_values(by_mode, to_search, tag)
-        doc = doc if doc else self.doc
+    ) -> List[Element]:
+        err_message, _ = selector_mode_values(by_mode, to_search, tag)
+        doc = self._resolve_doc(doc)
 
-        if doc is None or len(doc) == 0:
+        if doc is None:
             logger.error("Document is not loaded properly for xpath operations.")
             return []
+        elements = self.iter_find_elements(by_mode, to_search, doc, tag)
         try:
-            elements = doc.xpath(xpath)
-            return (
-                [NthScraperElement(element) for element in elements] if elements else []
-            )
+            return list(elements)
         except Exception as e:
-            logger.error(f"{err_message}: {e}")
+            logger.error("%s: %s", err_message, e)
             return []
 
     def find_element(
         self,
         by_mode: "By",
         to_search: str,
-        doc: Optional[html.HtmlElement] = None,
+        doc: Optional[Document] = None,
         tag: str = "node()",
-    ) -> "NthScraperElement":
-        err_message, xpath = selector_mode_values(by_mode, to_search, tag)
-        doc = doc if doc else self.doc
-        if doc is None or len(doc) == 0:
+    ) -> Element:
+        doc = self._resolve_doc(doc)
+        if doc is None:
             raise ReferenceError("HTML Document is not a valid lxml object")
+        elements = self.iter_find_elements(by_mode, to_search, doc, tag)
         try:
-            element = doc.xpath(xpath)[0]
-            return NthScraperElement(element)
+            element = next(elements, None)
         except Exception:
             raise ValueError("Failed to find Element")
+        if element is None:
+            raise ValueError("Failed to find Element")
+        return element
+
+    def find_element_or_none(
+        self,
+        by_mode: "By",
+        to_search: str,
+        doc: Optional[Document] = None,
+        tag: str = "node()",
+    ) -> Optional[Element]:
+        """Like find_element but return None instead of raising when nothing matches."""
+        return next(self.iter_find_elements(by_mode, to_search, doc, tag), None)
+
+    def __enter__(self):
+        return self
 
-        return NthScraperElement(element)
+    def __exit__(self, *exc):
+        self.requests_wrapper.__exit__(*exc)
@@ -2,8 +2,13 @@
 
 import time
 import random
+import threading
 import requests
-from typing import Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Optional
+from nthscraper.wrapper.local_file_adapter import LocalFileAdapter
+from nthscraper._ratelimit import TokenBucket
 from nthscraper.logger import setup_logger
 
 
@@ -11,7 +16,6 @@ logger = setup_logger()
 
 
 class RequestsWrapper:
-    web_hit_count = 0
     headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/50.0.2661.102 Safari/537.36"
     }
@@ -25,44 +29,90 @@ class RequestsWrapper:
         "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:15.0) Gecko/20100101 Firefox/15.0.1",
     ]
 
-    def __init__(self, **kwargs: Any):
+    pool_size = 32
+    default_retry = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        backoff_factor=0.3,
+        allowed_methods=frozenset(["GET", "POST", "HEAD"]),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+    def __init__(
+        self,
+        rate_per_sec: float = 0.5,
+        burst: int = 1,
+        retry: Optional[Retry] = None,
+        **kwargs: Any,
+    ):
+        """
+        :param rate_per_sec: average requests per second when no sleep_seconds is given
+        :param burst: requests allowed back to back before pacing kicks in
+        :param retry: urllib3 retry policy for http(s), defaults to default_retry
+        :param kwargs: default headers for the session
+        """
+        self.bucket = TokenBucket(rate_per_sec, burst)
+        self._hits = 0
+        self._hits_lock = threading.Lock()
         self.session = requests.Session()
+        self.session.headers.update(self.headers)
         self.session.headers.update(kwargs)
+        self.session.mount("file://", LocalFileAdapter())
+
+        # Mount a single pooled adapter so connections are kept alive per host
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry if retry is not None else self.default_retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def request(self, method: str, url: str, **kwargs: Any):
         """
         Wrap requests.request().
         """
-        sleep_seconds = kwargs.pop("sleep_seconds", random.randrange(1, 4))
-        time.sleep(float(sleep_seconds))
-
-        # Update headers with user-defined headers, if any
-        headers = kwargs.pop("headers", {})
-
-        # Randomly select a user agent
-        headers["User-Agent"] = random.choice(self.user_agents)
-
-        self.web_hit_count += 1
+        logger.info("%s from: url=%s, kwargs=%s", method, url, kwargs)
+        sleep_seconds = kwargs.pop("sleep_seconds", None)
+        if sleep_seconds is None:
+            self.bucket.acquire()
+        else:
+            time.sleep(float(sleep_seconds))
+
+        # Rotate the user agent per request, caller headers win and the session
+        # merges in its own defaults without being changed
+        headers = kwargs.pop("headers", None) or {}
+        headers = {"User-Agent": random.choice(self.user_agents), **headers}
+
+        web_hit_count = self.count_hit()
         resp = self.session.request(method, url, headers=headers, **kwargs)
-        logger.info(f"Response: status_code={resp.status_code}")
-        logger.info(f"headers={resp.request.headers}")
-        logger.info(f"web_hit_count={self.web_hit_count}")
+        logger.info("Response: status_code=%s", resp.status_code)
+        logger.info("headers=%s", resp.request.headers)
+        logger.info("web_hit_count=%s", web_hit_count)
         resp.raise_for_status()
         return resp
 
     def get(self, url: str, **kwargs: Any):
         """Send a GET Request"""
-        logger.info(f"GET from: url={url}, kwargs={kwargs}")
         return self.request("GET", url, **kwargs)
 
     def post(self, url: str, **kwargs: Any):
         """Send a POST request"""
-        logger.info(f"POST from: url={url}, kwargs={kwargs}")
         return self.request("POST", url, **kwargs)
 
+    def count_hit(self) -> int:
+        """Count a web hit, including async requests, and return the new count."""
+        with self._hits_lock:
+            self._hits += 1
+            return self._hits
+
     def get_hit_count(self):
         """Return the current web hit count."""
-        return self.web_hit_count
+        with self._hits_lock:
+            return self._hits
 
     def test_connection(self):
         """Test method to print a success message."""
@@ -1,19 +1,37 @@
+import os
 from setuptools import setup, find_packages
 
+# Set NTHSCRAPER_CYTHON=1 to compile the scraper module with Cython,
+# the pure Python module is used when Cython is not available.
+ext_modules = []
+if os.environ.get("NTHSCRAPER_CYTHON"):
+    try:
+        from Cython.Build import cythonize
+
+        ext_modules = cythonize(
+            ["nthscraper/scraper.py"],
+            compiler_directives={"language_level": 3, "annotation_typing": False},
+        )
+    except ImportError:
+        pass
+
 setup(
     name="nthscraper",
     version="0.0.1",
     packages=find_packages(),
     include_package_data=True,
+    ext_modules=ext_modules,
     install_requires=[
         "requests==2.31.0",
         "lxml==5.2.1",
         "pandas==2.2.2",
         "urllib3==2.2.1",
+        "aiohttp==3.9.5",
         "flask==3.0.3",
         "flask-apscheduler==1.13.1",
         "psutil==5.9.8",
         "pyyaml==6.0.1",
     ],
+    extras_require={"selectolax": ["selectolax==0.3.21"]},
     entry_points={"console_scripts": ["nthscraper=nthscraper.cli:main"]},
 )
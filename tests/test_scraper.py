@@ -1,9 +1,16 @@
+import asyncio
+import importlib.util
+import sys
 import unittest
+from unittest import mock
 import os
 import requests
+from aiohttp import ClientResponseError, web
+from lxml import html
 from nthscraper.wrapper.local_file_adapter import LocalFileAdapter
-from nthscraper.scraper import NthScraper
-from nthscraper.by import By
+from nthscraper.scraper import NthScraper, filter_inner_text
+from nthscraper.wrapper.requests_wrapper import RequestsWrapper
+from nthscraper.by import By, compiled_xpath, selector_mode_values
 from nthscraper.logger import setup_logger
 
 logger = setup_logger(log_file="", console_log=False)
@@ -41,11 +48,83 @@ class TestNthScraper(unittest.TestCase):
         )
         self.assertEqual(scraper.status_code, 200)
 
+    def test_scraping_online_site_async(self):
+        """testing getting many responses concurrently"""
+        urls = ["https://httpbin.org", "https://httpbin.org/html"]
+        results = asyncio.run(self.scraper.aget_many(urls, sleep_range=(0, 0)))
+        self.assertEqual([url for url, _, _ in results], urls)
+        for _, body, doc in results:
+            self.assertTrue(body)
+            self.assertIsNotNone(doc)
+
     def test_scraping_offline_site(self):
         """testing getting response from downloaded file"""
         scraper = self.scraper.get_from_local(f"{self.local_file_path}/tests/test.html")
         self.assertEqual(scraper.status_code, 200)
 
+    def test_scraping_parses_lazily(self):
+        """Testing that the document is only parsed once it is queried"""
+        self.scraper.get_from_local(f"{self.local_file_path}/tests/test.html")
+        self.assertIsNone(self.scraper._doc)
+        self.scraper.find_element(By.XPATH, "//h2[@class='title']")
+        doc = self.scraper._doc
+        self.assertIsNotNone(doc)
+        self.assertIs(self.scraper.doc, doc)
+
+    def test_scraping_stream_extract(self):
+        """Testing that a parser target receives the streamed document"""
+        links_url = f"file://{self.local_file_path}/tests/links.html"
+        self.assertEqual(
+            self.scraper.stream_extract(links_url, sleep_seconds=0),
+            ["https://example.com/", "/relative/page.html", "#top"],
+        )
+        empty_url = f"file://{self.local_file_path}/tests/empty.html"
+        self.assertEqual(self.scraper.stream_extract(empty_url, sleep_seconds=0), [])
+
+        file_url = f"file://{self.local_file_path}/tests/test.html"
+
+        class TagCounter:
+            def __init__(self):
+                self.count = 0
+
+            def start(self, tag, attrib):
+                self.count += tag == "a"
+
+            def close(self):
+                return self.count
+
+        count = self.scraper.stream_extract(file_url, TagCounter(), sleep_seconds=0)
+        self.assertEqual(count, 17)
+        self.assertIsNone(self.scraper.doc)
+
+        class TagList(list):
+            def start(self, tag, attrib):
+                self.append(tag)
+
+            def close(self):
+                return self
+
+        tags = self.scraper.stream_extract(links_url, TagList(), sleep_seconds=0)
+        self.assertIn("a", tags)
+
+    def test_scraping_streamed_document(self):
+        """Testing that stream=True parses the document from the response body"""
+        file_url = f"file://{self.local_file_path}/tests/test.html"
+        self.scraper.get(file_url, sleep_seconds=0, stream=True)
+        self.assertEqual(self.scraper.response.status_code, 200)
+        self.assertIsNotNone(self.scraper._doc)
+        elements = self.scraper.find_elements(By.XPATH, "//li//a")
+        self.assertEqual(len(elements), 16)
+
+    def test_scraping_unparsable_document(self):
+        """Testing that a whitespace only document is logged instead of raising"""
+        self.scraper.get_from_local(f"{self.local_file_path}/tests/blank.html")
+        with self.assertLogs("zenscraper", level="ERROR"):
+            self.assertEqual(self.scraper.find_elements(By.XPATH, "//p"), [])
+        self.assertIsNone(self.scraper.doc)
+        with self.assertRaises(ReferenceError):
+            self.scraper.find_element(By.XPATH, "//p")
+
     def test_scraping_element(self):
         """Testing if element is properly extracted"""
         self.scraper.get_from_local(f"{self.local_file_path}/tests/test.html")
@@ -61,6 +140,106 @@ class TestNthScraper(unittest.TestCase):
         for element in elements:
             self.assertIn("<a>", str(element))
 
+    def test_scraping_iter_elements(self):
+        """Testing that elements can be iterated lazily"""
+        self.scraper.get_from_local(f"{self.local_file_path}/tests/test.html")
+        elements = self.scraper.iter_find_elements(By.XPATH, "//li//a")
+        self.assertNotIsInstance(elements, list)
+        self.assertEqual(len(list(elements)), 16)
+
+        wrapper = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        tags = [el.get_tag_name() for el in wrapper.iter_find_elements(By.XPATH, "./p")]
+        self.assertEqual(tags, ["p", "p", "p"])
+
+    def test_scraping_childless_document(self):
+        """Testing that a document root without child elements is still queryable"""
+        doc = html.fromstring("<p>Only Text</p>")
+        self.assertEqual(len(doc), 0)
+        element = self.scraper.find_element(By.TAG_NAME, "p", doc=doc)
+        self.assertEqual(element.get_text(), "Only Text")
+        elements = self.scraper.find_elements(By.TEXT, "Only Text", doc=doc)
+        self.assertEqual(len(elements), 1)
+
+    def test_unsupported_parser(self):
+        """Test that unknown parser names are rejected"""
+        with self.assertRaises(ValueError):
+            NthScraper(parser="html5lib")
+
+
+class TestAsyncNthScraper(unittest.TestCase):
+    """tests to check the async batch api against a local server"""
+
+    @staticmethod
+    async def _ok(request):
+        return web.Response(text="<p>Ok</p>", content_type="text/html")
+
+    @staticmethod
+    async def _blank(request):
+        return web.Response(text="  \n")
+
+    @staticmethod
+    async def _echo(request):
+        headers = request.headers
+        return web.Response(text=f"<p>{headers['X-Test']}|{headers['User-Agent']}</p>")
+
+    async def _fetch_local(self, paths, scraper=None, **kwargs):
+        scraper = scraper if scraper is not None else NthScraper()
+        app = web.Application()
+        app.router.add_get("/ok", self._ok)
+        app.router.add_get("/blank", self._blank)
+        app.router.add_get("/echo", self._echo)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            urls = [f"http://127.0.0.1:{port}{path}" for path in paths]
+            return urls, await scraper.aget_many(urls, sleep_range=(0, 0), **kwargs)
+        finally:
+            await runner.cleanup()
+
+    def test_async_failed_url_keeps_batch(self):
+        """a failing url doesn't discard the other results"""
+        urls, results = asyncio.run(self._fetch_local(["/ok", "/missing", "/blank"]))
+        url, body, doc = results[0]
+        self.assertEqual(url, urls[0])
+        self.assertEqual(doc.text_content(), "Ok")
+        self.assertIsInstance(results[1], ClientResponseError)
+        self.assertEqual(results[2], (urls[2], b"  \n", None))
+
+    def test_async_uses_requests_wrapper(self):
+        """async requests use the wrapper headers and count as web hits"""
+        scraper = NthScraper()
+        scraper.requests_wrapper = RequestsWrapper(**{"X-Test": "1"})
+        _, results = asyncio.run(self._fetch_local(["/echo", "/echo"], scraper))
+        for _, _, doc in results:
+            value, user_agent = doc.text_content().split("|")
+            self.assertEqual(value, "1")
+            self.assertIn(user_agent, RequestsWrapper.user_agents)
+        self.assertEqual(scraper.requests_wrapper.get_hit_count(), 2)
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("selectolax"), "selectolax not installed"
+    )
+    def test_async_uses_scraper_parser(self):
+        """async documents are parsed with the scraper's parser backend"""
+        scraper = NthScraper(parser="selectolax")
+        _, results = asyncio.run(self._fetch_local(["/ok"], scraper))
+        element = scraper.find_element(By.TAG_NAME, "p", doc=results[0][2])
+        self.assertEqual(element.get_text(), "Ok")
+
+    def test_async_invalid_concurrency(self):
+        """a concurrency below 1 is rejected instead of hanging"""
+        with self.assertRaises(ValueError):
+            asyncio.run(NthScraper().aget_many(["http://127.0.0.1/"], concurrency=0))
+
+    def test_async_failed_url_raises(self):
+        """return_exceptions=False raises the first failure"""
+        with self.assertRaises(ClientResponseError):
+            asyncio.run(self._fetch_local(["/ok", "/missing"], return_exceptions=False))
+
+
 class TestZenElement(unittest.TestCase):
 
     def setUp(self):
@@ -87,6 +266,13 @@ class TestZenElement(unittest.TestCase):
         self.assertEqual(len(elements), 3)
         self.assertEqual("p", elements[0].get_tag_name())
 
+        wrapper = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        self.assertEqual(len(wrapper.get_children("p")), 3)
+        self.assertEqual(wrapper.get_children("span"), [])
+        self.assertEqual(wrapper.get_children("{http://x}p"), [])
+        children = wrapper.iter_children()
+        self.assertEqual([c.get_tag_name() for c in children], ["p", "p", "p"])
+
     def test_finding_element_by_mode(self):
         """Test searching element by mode, XPATH will be skipped because it
         is heavily used in the initial tests, assuming it works properly
@@ -118,3 +304,148 @@ class TestZenElement(unittest.TestCase):
         element = self.scraper.find_element(By.TEXT, "Malakas")
         self.assertEqual(element.get_tag_name(), "p")
         self.assertEqual(element.get_attribute("id"), "sakalam")
+
+    def test_compiled_xpath_is_cached(self):
+        """Test that repeated selectors reuse the cached xpath and compiled expression"""
+        self.assertIs(compiled_xpath("//li//a"), compiled_xpath("//li//a"))
+        self.assertIs(
+            selector_mode_values(By.ID, "sakalam"),
+            selector_mode_values(By.ID, "sakalam"),
+        )
+        elements = self.scraper.find_elements(By.XPATH, "//li//a")
+        self.assertEqual(len(elements), 16)
+
+    def test_element_inner_text_filter(self):
+        """Test innerText filtering with default and custom filters"""
+        element = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        inner_text = element.get_attribute("innerText")
+        self.assertNotIn("\n", inner_text)
+        self.assertTrue(inner_text.startswith("!Wrapper Class"))
+
+        inner_text = element.get_attribute("innerText", ["\n", " ", "Wrapper"])
+        self.assertEqual(inner_text, "!ClassContentEnd")
+
+        # filters apply in the given order when they mix lengths
+        self.assertEqual(filter_inner_text("a\nb", ["ab", "\n"]), "ab")
+
+    def test_element_find_element_or_none(self):
+        """Test probing for optional elements without exceptions"""
+        wrapper = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        self.assertEqual(
+            wrapper.find_element_or_none(By.XPATH, "./p").get_tag_name(), "p"
+        )
+        self.assertIsNone(wrapper.find_element_or_none(By.XPATH, "./table"))
+        self.assertIsNone(self.scraper.find_element_or_none(By.ID, "missing"))
+        with self.assertRaises(ValueError):
+            wrapper.find_element(By.XPATH, "./table")
+
+    def test_css_not_supported_by_lxml(self):
+        """Test that css lookups are rejected by the lxml parser"""
+        with self.assertRaises(NotImplementedError):
+            self.scraper.find_elements(By.CSS, "li a")
+        with self.assertRaises(NotImplementedError):
+            self.scraper.find_element(By.CSS, "li a")
+        wrapper = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        with self.assertRaises(NotImplementedError):
+            wrapper.find_elements(By.CSS, "p")
+        with self.assertRaises(NotImplementedError):
+            wrapper.find_element(By.CSS, "p")
+
+    def test_element_find_elements_invalid_xpath(self):
+        """Test that an invalid xpath is logged and returns no elements"""
+        element = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        with self.assertLogs("zenscraper", level="ERROR"):
+            self.assertEqual(element.find_elements(By.XPATH, ".//["), [])
+
+
+@unittest.skipUnless(importlib.util.find_spec("selectolax"), "selectolax not installed")
+class TestSelectolaxScraper(unittest.TestCase):
+    """tests to check the selectolax parser backend"""
+
+    def setUp(self):
+        self.scraper = NthScraper(parser="selectolax")
+        self.local_file_path = os.path.abspath(os.path.curdir)
+        self.scraper.get_from_local(f"{self.local_file_path}/tests/test.html")
+
+    def test_selectolax_finding_element_by_mode(self):
+        """Test searching elements by mode with the selectolax parser"""
+        element = self.scraper.find_element(By.ID, "sakalam")
+        self.assertEqual("Malakas", element.get_text().strip())
+
+        element = self.scraper.find_element(By.CLASS_NAME, "wrapper")
+        self.assertIn("!Wrapper Class", element.get_attribute("innerText"))
+        self.assertEqual(len(element.get_children()), 3)
+
+        elements = self.scraper.find_elements(By.CSS, "li a")
+        self.assertEqual(len(elements), 16)
+
+        element = self.scraper.find_element(By.TEXT, "Malakas")
+        self.assertEqual(element.get_tag_name(), "p")
+        self.assertEqual(element.get_attribute("id"), "sakalam")
+
+        elements = self.scraper.find_elements(By.LINK_TEXT, "Wrapper")
+        self.assertEqual(len(elements), 4)
+
+    def test_selectolax_children_skip_comments(self):
+        """Test that comment nodes are not returned as children"""
+        doc = self.scraper._selectolax_parse(b"<div><!-- c --><p></p><b></b></div>")
+        element = self.scraper.find_element(By.TAG_NAME, "div", doc=doc)
+        tags = [child.get_tag_name() for child in element.get_children()]
+        self.assertEqual(tags, ["p", "b"])
+
+    def test_selectolax_invalid_css_selector(self):
+        """Test that an invalid css selector is logged with a css error message"""
+        with self.assertLogs("zenscraper", level="ERROR") as logs:
+            self.assertEqual(self.scraper.find_elements(By.CSS, "[[["), [])
+        self.assertIn("CSS selector '[[['", logs.output[0])
+
+    def test_selectolax_matches_lxml_element(self):
+        """Test that text, attributes and parents match the lxml element"""
+        content = b"<div><p>a<b>b</b>c</p><input disabled></div>"
+        lxml_scraper = NthScraper()
+        for scraper in (self.scraper, lxml_scraper):
+            doc = scraper._parse(content)
+            element = scraper.find_element(By.TAG_NAME, "p", doc=doc)
+            self.assertEqual(element.get_text(all_text_content=False), "a")
+            self.assertEqual(element.get_text(), "abc")
+            bold = scraper.find_element(By.TAG_NAME, "b", doc=doc)
+            self.assertEqual(bold.get_text(all_text_content=False), "b")
+            element = scraper.find_element(By.TAG_NAME, "input", doc=doc)
+            self.assertEqual(element.get_attribute("disabled"), "disabled")
+            with self.assertRaises(ValueError):
+                element.get_attribute("value")
+            root = scraper.find_element(By.TAG_NAME, "html", doc=doc)
+            self.assertIsNone(root.get_parent())
+            self.assertEqual(root.get_children()[0].get_parent().get_tag_name(), "html")
+
+    def test_selectolax_empty_document_parsed_once(self):
+        """Test that a body without a document is only parsed once"""
+        self.scraper._raw_content = b"  "
+        self.scraper.doc = None
+        parse = mock.Mock(return_value=None)
+        with mock.patch.object(self.scraper, "_selectolax_parse", parse):
+            self.assertIsNone(self.scraper.doc)
+            self.assertIsNone(self.scraper.doc)
+        parse.assert_called_once()
+
+    def test_selectolax_xpath_not_supported(self):
+        """Test that xpath lookups are rejected by the selectolax parser"""
+        with self.assertRaises(NotImplementedError):
+            self.scraper.find_elements(By.XPATH, "//li//a")
+
+    def test_selectolax_rejects_lxml_doc(self):
+        """Test that documents from the other parser are rejected"""
+        doc = html.fromstring("<p>Malakas</p>")
+        with self.assertRaises(TypeError):
+            self.scraper.find_elements(By.TAG_NAME, "p", doc=doc)
+        with self.assertRaises(TypeError):
+            self.scraper.find_element(By.TAG_NAME, "p", doc=doc)
+        with self.assertRaises(TypeError):
+            NthScraper().find_elements(By.TAG_NAME, "p", doc=self.scraper.doc)
+
+    def test_selectolax_not_installed(self):
+        """Test that a missing selectolax package fails when creating the scraper"""
+        missing = {"selectolax.parser": None, "nthscraper._selectolax_backend": None}
+        with mock.patch.dict(sys.modules, missing):
+            with self.assertRaisesRegex(ImportError, "selectolax"):
+                NthScraper(parser="selectolax")
@@ -1,7 +1,10 @@
 import unittest
+import os
+from urllib3.util.retry import Retry
 from nthscraper.wrapper.requests_wrapper import RequestsWrapper
 from nthscraper.logger import setup_logger
 from nthscraper.wrapper.row import Row
+from nthscraper._ratelimit import TokenBucket
 
 logger = setup_logger(log_file="", console_log=False)
 
@@ -33,6 +36,64 @@ class TestRequestsWrapper(unittest.TestCase):
             RW.get("https://httpbin.org/", sleep_seconds=0)
             self.assertEqual(RW.get_hit_count(), 2)
 
+    def test_request_wrapper_local_file(self):
+        """test file:// urls are served through the wrapper session"""
+        file_path = os.path.abspath(os.path.curdir) + "/tests/test.html"
+        with RequestsWrapper() as RW:
+            res = RW.session.get(f"file://{file_path}")
+            self.assertEqual(res.status_code, 200)
+
+    def test_request_wrapper_headers(self):
+        """session headers are merged with per request headers"""
+        file_path = os.path.abspath(os.path.curdir) + "/tests/test.html"
+        headers = {"X-Test": "1"}
+        with RequestsWrapper(**{"Accept-Language": "en"}) as RW:
+            res = RW.get(f"file://{file_path}", headers=headers, sleep_seconds=0)
+            self.assertEqual(res.request.headers["X-Test"], "1")
+            self.assertEqual(res.request.headers["Accept-Language"], "en")
+            self.assertIn(res.request.headers["User-Agent"], RW.user_agents)
+            self.assertEqual(RW.session.headers["User-Agent"], RW.headers["User-Agent"])
+
+            custom = {"User-Agent": "nthscraper-test"}
+            res = RW.get(f"file://{file_path}", headers=custom, sleep_seconds=0)
+            self.assertEqual(res.request.headers["User-Agent"], "nthscraper-test")
+        self.assertEqual(headers, {"X-Test": "1"})
+
+    def test_request_wrapper_retry(self):
+        """retry policy is set on the http(s) adapters"""
+        with RequestsWrapper() as RW:
+            adapter = RW.session.get_adapter("https://httpbin.org/")
+            self.assertIs(adapter.max_retries, RequestsWrapper.default_retry)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+
+        retry = Retry(total=1)
+        with RequestsWrapper(retry=retry) as RW:
+            self.assertIs(RW.session.get_adapter("http://").max_retries, retry)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Testing the rate limiter used by the requests wrapper"""
+
+    def test_token_bucket_burst(self):
+        """requests within the burst don't wait, the next one does"""
+        bucket = TokenBucket(rate=100, capacity=2)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertGreater(bucket.acquire(), 0)
+
+    def test_token_bucket_invalid(self):
+        """rate has to be positive"""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_request_wrapper_rate_limit_local_file(self):
+        """requests without sleep_seconds go through the wrapper bucket"""
+        file_path = os.path.abspath(os.path.curdir) + "/tests/test.html"
+        with RequestsWrapper(rate_per_sec=100, burst=1) as RW:
+            RW.get(f"file://{file_path}")
+            RW.get(f"file://{file_path}")
+            self.assertEqual(RW.get_hit_count(), 2)
+
 
 class TestRow(unittest.TestCase):
     """Testing Row class for creating row fields"""